@@ -23,44 +23,123 @@ optionally fall back to HTTP communication on port 5##13.
 
 Currently, only basic authentication (username/password) is implemented.
 
+The WSDL of the sapcontrol webservice is cached on the minion. The cache can be configured in the
+minion configuration:
+
+.. code-block:: yaml
+
+    sap_control.wsdl_cache_path: /var/cache/salt/minion/sap_control_wsdl.db
+    sap_control.wsdl_cache_timeout: 86400
+
 .. note::
     This module was only tested on linux platforms.
 """
+import atexit
+import collections
+import copy
+import functools
+import inspect
 import logging
+import operator
+import os
+import re
+import socket
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as dt
 
 import salt.utils.http
 import salt.utils.path
 import salt.utils.platform
 
+# contextvars is only available in Python >= 3.7
+CONTEXTVARSLIB = True
+try:
+    import contextvars
+except ImportError:
+    CONTEXTVARSLIB = None
+
 # Third Party libs
 ZEEPLIB = True
 try:
     from zeep import Client
+    from zeep import Settings
+    from zeep.cache import InMemoryCache
+    from zeep.cache import SqliteCache
     from zeep.transports import Transport
     from zeep.exceptions import Fault
 except ImportError:
     ZEEPLIB = None
 REQUESTSLIB = True
 try:
+    from requests.exceptions import ConnectionError as RequestsConnectionError
     from requests.exceptions import SSLError
     from requests.auth import HTTPBasicAuth
     from requests import Session
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     REQUESTSLIB = None
 
 # Globals
 log = logging.getLogger(__name__)
-logging.getLogger("zeep").setLevel(logging.WARNING)  # data from here is not really required
 
 SAPCONTROL_GRAY = 1
 SAPCONTROL_GREEN = 2
 SAPCONTROL_YELLOW = 3
 SAPCONTROL_RED = 4
 
+_DISPSTATUS_MAP = {
+    "SAPControl-GREEN": SAPCONTROL_GREEN,
+    "SAPControl-YELLOW": SAPCONTROL_YELLOW,
+    "SAPControl-RED": SAPCONTROL_RED,
+    "SAPControl-GRAY": SAPCONTROL_GRAY,
+}
+
 SAPCONTROL_FALLBACK_PATH = "/usr/sap/hostctrl/exe/sapcontrol"
 
+# ports 5##14 (HTTPS) / 5##13 (HTTP) for instance number ##
+HTTPS_PORT_BASE = 50014
+HTTP_PORT_BASE = 50013
+_HTTPS_URL = "https://{}:{}/?wsdl".format
+_HTTP_URL = "http://{}:{}/?wsdl".format
+
+# syslog timestamps have the format "%Y %m %d %H:%M:%S"
+_SYSLOG_TIME_RE = re.compile(r"(\d{4}) (\d{2}) (\d{2}) (\d{2}):(\d{2}):(\d{2})")
+
+# zeep objects implement attribute access in Python (__getattribute__), item access is cheaper
+_INSTANCE_FIELDS = operator.itemgetter("hostname", "instanceNr", "startPriority", "features")
+_PROCESS_NAME = operator.itemgetter("name")
+_PROCESS_DISPSTATUS = operator.itemgetter("dispstatus")
+
+# SOAP clients are cached by (fqdn, instance_number, username, password, scheme, operation_timeout)
+# in order to reuse the parsed WSDL and the connection pool of the underlying requests session
+_CLIENT_CACHE = {}
+# HTTP fallback clients are only used for a limited time, afterwards HTTPS is tried again
+_FALLBACK_EXPIRY = {}
+HTTP_FALLBACK_TTL = 300
+_WSDL_CACHE = None
+WSDL_CACHE_TIMEOUT = 86400
+# parsed WSDL documents by (fqdn, instance_number, scheme)
+_WSDL_DOCUMENTS = {}
+
+# results of GetSystemInstanceList() are shared per client for a short amount of time
+_INSTANCE_LIST_CACHE = {}
+INSTANCE_LIST_TTL = 2
+
+# timeout for the TCP check before setting up a SOAP connection
+PREFLIGHT_TIMEOUT = 0.2
+# default timeouts for loading the WSDL and for SOAP operations, long running operations like
+# StartSystem / StopSystem raise the operation timeout for the call itself
+TIMEOUT = 30
+OPERATION_TIMEOUT = 60
+
+# connection pool / retry settings for the requests session
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+MAX_RETRIES = 2
+RETRY_BACKOFF_FACTOR = 0.2
+
 __virtualname__ = "sap_control"
 
 
@@ -72,78 +151,542 @@ def __virtual__():
         return False, "Could not load sap_control module, zeep unavailable"
     if not REQUESTSLIB:
         return False, "Could not load sap_control module, requests unavailable"
+    if not CONTEXTVARSLIB:
+        return False, "Could not load sap_control module, contextvars unavailable"
     if salt.utils.platform.is_windows():
         return False, "This module doesn't work on Windows."
+    logging.getLogger("zeep").setLevel(logging.WARNING)  # data from here is not really required
     return __virtualname__
 
 
+# successful lookups of _which() by (executable, runas)
+_WHICH_CACHE = {}
+
+
 def _which(executable, runas=None):
     """
     Similar to salt.utils.path.which(), but:
      - Only works on Linux
      - Allows runas
+     - Found executables are cached, use ``_which.cache_clear()`` to reset the cache
 
     If not runas is given, the salt minion user is used
     """
+    key = (executable, runas)
+    path = _WHICH_CACHE.get(key)
+    if path:
+        return path
     ret = __salt__["cmd.run_all"](cmd=f"which {executable}", runas=runas)
     if ret["retcode"]:
+        # not cached, the executable might be installed / the PATH be set up later on
         return None
-    return ret["stdout"]
+    path = ret["stdout"]
+    _WHICH_CACHE[key] = path
+    return path
+
 
+_which.cache_clear = _WHICH_CACHE.clear
 
-def _get_client(instance_number, username, password, fallback=True, fqdn=None, timeout=300):
+
+_LOCAL_FQDN = None
+
+
+def _local_fqdn():
     """
-    Creates and returns a SOAP client.
+    Returns the FQDN of the current host. The grain is only looked up once.
+    """
+    global _LOCAL_FQDN  # pylint: disable=global-statement
+    if _LOCAL_FQDN is None:
+        _LOCAL_FQDN = __grains__["fqdn"]
+    return _LOCAL_FQDN
 
-    This is **not** identical to sap_hostctrl._get_client()
+
+# normalized target of a sapcontrol instance, see _normalize()
+_Target = collections.namedtuple("_Target", ["nr_str", "nr", "fqdn", "host", "domain"])
+
+
+@functools.lru_cache(maxsize=128)
+def _norm_instance(instance_number):
+    """
+    Returns the instance number as two-digit string, e.g. ``0`` => ``"00"``.
+    """
+    return format(int(instance_number), "02")
+
+
+def _normalize(instance_number, fqdn=None):
+    """
+    Normalizes instance number and FQDN of a sapcontrol instance once, so that the values can be
+    passed around instead of being reformatted in every function (and every poll).
+
+    If no fqdn is given, the FQDN of the current host is used.
     """
     if not fqdn:
-        fqdn = __grains__["fqdn"]
+        fqdn = _local_fqdn()
+    nr_str = _norm_instance(instance_number)
+    host, _, domain = fqdn.partition(".")
+    return _Target(nr_str, int(nr_str), fqdn, host, domain)
+
+
+def _close_clients():
+    """
+    Closes all sessions of cached SOAP clients and clears the cache (including parsed WSDL
+    documents). Also available as ``_get_client.cache_clear()``.
+    """
+    for client in _CLIENT_CACHE.values():
+        try:
+            client.transport.session.close()
+        except Exception:  # pylint: disable=broad-except
+            pass
+    _CLIENT_CACHE.clear()
+    _FALLBACK_EXPIRY.clear()
+    _INSTANCE_LIST_CACHE.clear()
+    _WSDL_DOCUMENTS.clear()
+
+
+atexit.register(_close_clients)
+
+
+def _drop_client(key):
+    """
+    Closes and removes the cached client for ``key`` (and its cached instance list).
+    """
+    client = _CLIENT_CACHE.pop(key, None)
+    _FALLBACK_EXPIRY.pop(key, None)
+    if client:
+        _INSTANCE_LIST_CACHE.pop(client, None)
+        client.transport.session.close()
+
+
+def _evict_clients(fqdn, instance_number):
+    """
+    Closes and removes all cached clients (and their cached instance lists) for an instance.
+    """
+    for key in [key for key in _CLIENT_CACHE if key[:2] == (fqdn, instance_number)]:
+        _drop_client(key)
+
+
+def _get_wsdl_cache():
+    """
+    Returns the persistent WSDL cache, which is located in the cachedir of the minion by default.
+    If the cache database cannot be used, an in-memory cache is used instead.
+    """
+    global _WSDL_CACHE  # pylint: disable=global-statement
+    if _WSDL_CACHE is None:
+        path = __salt__["config.get"](
+            "sap_control.wsdl_cache_path", os.path.join(__opts__["cachedir"], "sap_control_wsdl.db")
+        )
+        timeout = __salt__["config.get"]("sap_control.wsdl_cache_timeout", WSDL_CACHE_TIMEOUT)
+        try:
+            _WSDL_CACHE = SqliteCache(path=path, timeout=timeout)
+        except Exception as exc:  # pylint: disable=broad-except
+            log.warning("Cannot use WSDL cache %s, falling back to in-memory cache: %s", path, exc)
+            _WSDL_CACHE = InMemoryCache(timeout=timeout)
+    return _WSDL_CACHE
 
-    if isinstance(instance_number, int):
-        instance_number = format(instance_number, "02")
 
+def _get_session(username, password, verify):
+    """
+    Creates a requests session with basic authentication and a tuned connection pool.
+    Connections are kept alive by the pool, so subsequent requests over a cached session skip
+    the TCP / TLS handshake. Failed connection attempts are retried with a small backoff.
+    """
     session = Session()
-    session.verify = salt.utils.http.get_ca_bundle()
+    session.verify = verify
     session.auth = HTTPBasicAuth(username, password)
-    transport = Transport(session=session, timeout=timeout, operation_timeout=timeout)
-    url = f"https://{fqdn}:5{instance_number}14/?wsdl"
-    log.debug(f"Retrieving services from {url}")
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF_FACTOR),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _connect(
+    url, session, wsdl_key, timeout=TIMEOUT, operation_timeout=OPERATION_TIMEOUT, use_cache=True
+):
+    """
+    Creates a SOAP client for the WSDL at ``url``. ``timeout`` is used for loading the WSDL,
+    ``operation_timeout`` for the SOAP operations.
+
+    If ``use_cache`` is ``True``, an already parsed WSDL document for ``wsdl_key`` is reused and
+    the WSDL is read from the persistent WSDL cache if available. Otherwise the WSDL is always
+    retrieved from sapcontrol (and the cache is refreshed), i.e. the client creation fails if
+    sapcontrol is not reachable.
+
+    A client created from cached data is checked with a first SOAP call, so that wrong credentials
+    or certificates are detected during client creation like with a fresh WSDL download.
+    """
+    cache = _get_wsdl_cache()
+    if not use_cache:
+        log.debug("Refreshing cached WSDL for %s", url)
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+        cache.add(url, response.content)
+        _WSDL_DOCUMENTS.pop(wsdl_key, None)
+    transport = Transport(
+        session=session,
+        cache=cache,
+        timeout=timeout,
+        operation_timeout=operation_timeout,
+    )
+    wsdl = _WSDL_DOCUMENTS.get(wsdl_key, url)
+    settings = Settings(strict=False, xml_huge_tree=False, force_https=False)
+    client = Client(wsdl, transport=transport, settings=settings)
+    _WSDL_DOCUMENTS[wsdl_key] = client.wsdl
+    if use_cache:
+        # the client was possibly created without any request to sapcontrol
+        client.service.GetProcessList()
+    return client
+
+
+def _get_client(
+    instance_number,
+    username,
+    password,
+    fallback=True,
+    fqdn=None,
+    timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    use_cache=True,
+    target=None,
+):
+    """
+    Creates and returns a SOAP client.
+
+    Clients are cached per host, instance number, user and protocol. If ``use_cache`` is set to
+    ``False``, a new connection will be established (and cached) regardless of existing clients or
+    cached WSDL documents, which is required if the client is used to check whether sapcontrol is
+    reachable.
+    Clients of the HTTP fallback are only reused for ``HTTP_FALLBACK_TTL`` seconds, afterwards
+    HTTPS is tried again.
+
+    If the target was already normalized with ``_normalize()``, it can be passed as ``target``.
+
+    ``timeout`` is the timeout for loading the WSDL, ``operation_timeout`` the default timeout for
+    SOAP operations of the client. Clients are cached per ``operation_timeout`` as well, the WSDL
+    timeout only applies to new clients.
+
+    This is **not** identical to sap_hostctrl._get_client()
+    """
+    if target is None:
+        target = _normalize(instance_number, fqdn)
+    instance_number, fqdn = target.nr_str, target.fqdn
+
+    https_key = (fqdn, instance_number, username, password, "https", operation_timeout)
+    http_key = (fqdn, instance_number, username, password, "http", operation_timeout)
+    if use_cache:
+        client = _CLIENT_CACHE.get(https_key)
+        if not client and fallback:
+            client = _CLIENT_CACHE.get(http_key)
+            if client and time.time() > _FALLBACK_EXPIRY.get(http_key, 0):
+                # don't send the credentials unencrypted forever after a single HTTPS failure
+                log.debug("HTTP client for %s / %s expired, trying HTTPS", fqdn, instance_number)
+                _drop_client(http_key)
+                client = None
+        if client:
+            log.debug("Using cached client for %s / %s", fqdn, instance_number)
+            return client
+    else:
+        for key in [https_key, http_key]:
+            _drop_client(key)
+
     client = None
-    try:
-        client = Client(url, transport=transport)
-    except SSLError as ssl_ex:
-        log.debug(f"Got an exception:\n{ssl_ex}")
-        if "certificate verify failed" in ssl_ex.__str__():
-            log.error(f"Could not verify SSL certificate of {fqdn}")
-        else:
-            log.error(f"Cannot setup connection to sapcontrol on {fqdn}")
+    https_port = HTTPS_PORT_BASE + 100 * target.nr
+    http_port = HTTP_PORT_BASE + 100 * target.nr
+    url = _HTTPS_URL(fqdn, https_port)
+    https_open = True
+    if fallback:
+        # a closed HTTPS port would otherwise only be detected after the (long) connection timeout,
+        # check both ports at once and skip HTTPS only if HTTP is known to be reachable. A slow
+        # host may miss the preflight timeout, so the last option is always tried for real.
+        https_open, http_open = _parallel_map(
+            _port_open,
+            [
+                {"fqdn": fqdn, "port": https_port, "timeout": PREFLIGHT_TIMEOUT},
+                {"fqdn": fqdn, "port": http_port, "timeout": PREFLIGHT_TIMEOUT},
+            ],
+        )
+        https_open = https_open or not http_open
+    if not https_open:
+        log.debug("Port %s on %s is not reachable, skipping HTTPS", https_port, fqdn)
         client = False
-    except Exception as exc:  # pylint: disable=broad-except
-        log.debug(f"Got an exception:\n{exc}")
-        log.error(f"Cannot setup connection to sapcontrol on {fqdn}")
+    else:
+        session = _get_session(username, password, verify=salt.utils.http.get_ca_bundle())
+        log.debug("Retrieving services from %s", url)
+        try:
+            client = _connect(
+                url,
+                session,
+                (fqdn, instance_number, "https"),
+                timeout=timeout,
+                operation_timeout=operation_timeout,
+                use_cache=use_cache,
+            )
+            _CLIENT_CACHE[https_key] = client
+        except SSLError as ssl_ex:
+            log.debug("Got an exception:\n%s", ssl_ex)
+            if "certificate verify failed" in str(ssl_ex):
+                log.error("Could not verify SSL certificate of %s", fqdn)
+            else:
+                log.error("Cannot setup connection to sapcontrol on %s", fqdn)
+            client = False
+        except Exception as exc:  # pylint: disable=broad-except
+            log.debug("Got an exception:\n%s", exc)
+            log.error("Cannot setup connection to sapcontrol on %s", fqdn)
+        if not client:
+            session.close()
 
     if fallback and not client:
         log.warning("HTTPS connection failed, trying  over an unsecure HTTP connection!")
-        session.verify = False
-        url = f"http://{fqdn}:5{instance_number}13/?wsdl"
+        session = _get_session(username, password, verify=False)
+        url = _HTTP_URL(fqdn, http_port)
         try:
-            client = Client(url, transport=transport)
+            client = _connect(
+                url,
+                session,
+                (fqdn, instance_number, "http"),
+                timeout=timeout,
+                operation_timeout=operation_timeout,
+                use_cache=use_cache,
+            )
+            _CLIENT_CACHE[http_key] = client
+            _FALLBACK_EXPIRY[http_key] = time.time() + HTTP_FALLBACK_TTL
         except Exception as exc:  # pylint: disable=broad-except
             # possible exceptions unclear / undocumented
-            log.debug(f"Got an exception:\n{exc}")
-            log.error(f"Cannot setup connection to sapcontrol on {fqdn}")
+            log.debug("Got an exception:\n%s", exc)
+            log.error("Cannot setup connection to sapcontrol on %s", fqdn)
             return False
 
     return client
 
 
+_get_client.cache_clear = _close_clients
+
+
+def _with_operation_timeout(client, timeout):
+    """
+    Returns a client for long running operations, which shares WSDL and session with ``client``
+    but uses ``timeout`` as operation timeout. The transport of ``client`` is not modified, since
+    cached clients are shared between calls and threads.
+    """
+    transport = copy.copy(client.transport)
+    transport.operation_timeout = timeout
+    return Client(client.wsdl, transport=transport, settings=client.settings)
+
+
+def _handle_connection_errors(failure):
+    """
+    Decorator for functions that use (cached) clients. If sapcontrol isn't reachable anymore, e.g.
+    because it was stopped after the client was cached, all cached clients of the instance are
+    removed and ``failure`` is returned like if no connection could be established.
+
+    ``failure`` can also be a callable, which is called with the arguments of the function.
+    """
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except RequestsConnectionError as exc:
+                arguments = signature.bind(*args, **kwargs).arguments
+                target = _normalize(arguments["instance_number"], arguments.get("fqdn"))
+                log.debug("Got an exception:\n%s", exc)
+                log.error("Lost connection to sapcontrol on %s", target.fqdn)
+                _evict_clients(target.fqdn, target.nr_str)
+                return failure(**arguments) if callable(failure) else failure
+
+        return wrapper
+
+    return decorator
+
+
+def _per_process(value):
+    """
+    Returns a failure callable for ``_handle_connection_errors()`` which returns ``value`` for
+    every process in ``process_names``.
+    """
+
+    def failure(process_names, **kwargs):
+        if isinstance(process_names, str):
+            process_names = [process_names]
+        return dict.fromkeys(process_names, value)
+
+    return failure
+
+
+def _poll(predicate, timeout, initial=0.1, max_interval=2.0, backoff=1.5):
+    """
+    Calls ``predicate`` until it returns a truthy value or ``timeout`` seconds have passed.
+
+    The interval between two calls starts at ``initial`` seconds and is multiplied by ``backoff``
+    after every unsuccessful call, capped at ``max_interval`` seconds. The function will never
+    sleep past the deadline.
+
+    Returns ``True`` if the predicate was fulfilled in time, else ``False``.
+    """
+    deadline = time.time() + timeout
+    interval = initial
+    while True:
+        if predicate():
+            return True
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return False
+        time.sleep(min(remaining, interval))
+        interval = min(interval * backoff, max_interval)
+
+
+def _port_open(fqdn, port, timeout=0.5):
+    """
+    Returns ``True`` if a TCP connection to ``fqdn:port`` can be established within ``timeout``
+    seconds, else ``False``.
+    """
+    try:
+        with socket.create_connection((fqdn, port), timeout):
+            return True
+    except OSError:
+        return False
+
+
+def _call_safely(fn, **kwargs):
+    """
+    Calls ``fn`` with ``kwargs`` and returns ``False`` if an exception is raised. For calls to
+    sapcontrol instances, the instance is logged as well.
+    """
+    try:
+        return fn(**kwargs)
+    except Exception as exc:  # pylint: disable=broad-except
+        log.debug("Got an exception:\n%s", exc, exc_info=True)
+        if "instance_number" in kwargs:
+            log.error(
+                "%s failed for instance %s on %s: %s",
+                fn.__name__,
+                kwargs["instance_number"],
+                kwargs.get("fqdn"),
+                exc,
+            )
+        else:
+            log.error("Calling %s failed: %s", fn.__name__, exc)
+        return False
+
+
+def _parallel_map(fn, kwargs_list, max_workers=16):
+    """
+    Calls ``fn`` for every set of keyword arguments in ``kwargs_list`` in a thread pool and
+    returns the results in the same order. If a call raises an exception, its result is ``False``
+    so that a single failure doesn't discard the results of all other calls.
+
+    Every call runs in a copy of the current context so that the salt dunders stay available.
+    """
+    if not kwargs_list:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(kwargs_list))) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, _call_safely, fn, **kwargs)
+            for kwargs in kwargs_list
+        ]
+        return [future.result() for future in futures]
+
+
+def _run_many(fn, targets, **defaults):
+    """
+    Runs ``fn`` for all ``targets`` in parallel. Every target is a dictionary with at least
+    ``instance_number`` and ``fqdn``, which can override the ``defaults``.
+
+    Returns a dictionary ``{"<fqdn>:<instance_number>": <result>}``. The result of targets for
+    which ``fn`` raised an exception is ``False``, all other targets are not affected.
+    """
+    kwargs_list = [{**defaults, **target} for target in targets]
+    results = _parallel_map(fn, kwargs_list)
+    ret = {}
+    for kwargs, result in zip(kwargs_list, results):
+        target = _normalize(kwargs["instance_number"], kwargs.get("fqdn"))
+        ret[f"{target.fqdn}:{target.nr_str}"] = result
+    return ret
+
+
+def _get_instances_by_key(client):
+    """
+    Returns the result of GetSystemInstanceList() as dictionary keyed by
+    ``(hostname, instance_number)``. Results are reused for ``INSTANCE_LIST_TTL`` seconds.
+    """
+    now = time.time()
+    cached = _INSTANCE_LIST_CACHE.get(client)
+    if cached and now - cached[0] < INSTANCE_LIST_TTL:
+        return cached[1]
+    instances = client.service.GetSystemInstanceList() or []
+    by_key = {
+        (instance["hostname"], format(instance["instanceNr"], "02")): instance
+        for instance in instances
+    }
+    _INSTANCE_LIST_CACHE[client] = (now, by_key)
+    return by_key
+
+
+def _find_processes(client, process_names):
+    """
+    Returns the processes with the given names from GetProcessList() as dictionary keyed by name.
+    The scan stops as soon as all processes were found.
+    """
+    wanted = set(process_names)
+    ret = {}
+    processes = client.service.GetProcessList() or []
+    for name, process in zip(map(_PROCESS_NAME, processes), processes):
+        if name in wanted:
+            ret[name] = process
+            if len(ret) == len(wanted):
+                break
+    return ret
+
+
+def _local_dispstatus(client):
+    """
+    Derives the status of the instance the client is connected to from its process list.
+
+    The status is aggregated as follows:
+     - any process is RED => SAPCONTROL_RED
+     - any process is YELLOW => SAPCONTROL_YELLOW
+     - all processes are GREEN => SAPCONTROL_GREEN
+     - all processes are GRAY => SAPCONTROL_GRAY
+     - else (e.g. some processes are still running or no processes) => SAPCONTROL_YELLOW
+    """
+    statuses = set()
+    for dispstatus in map(_PROCESS_DISPSTATUS, client.service.GetProcessList() or []):
+        status = _DISPSTATUS_MAP.get(dispstatus)
+        if status is None:
+            msg = f"Unknown process status {dispstatus}"
+            log.error(msg)
+            raise Exception(msg)
+        statuses.add(status)
+    if SAPCONTROL_RED in statuses:
+        return SAPCONTROL_RED
+    if statuses == {SAPCONTROL_GREEN}:
+        return SAPCONTROL_GREEN
+    if statuses == {SAPCONTROL_GRAY}:
+        return SAPCONTROL_GRAY
+    return SAPCONTROL_YELLOW
+
+
 # pylint: disable=too-many-leading-hastag-for-block-comment
 ### CONTROL ########################################################################################################
 
 
 # pylint: disable=unused-argument
-def status(instance_number, username, password, fallback=True, fqdn=None, **kwargs):
+def status(
+    instance_number,
+    username,
+    password,
+    fallback=True,
+    fqdn=None,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
+):
     """
     Retrieve the current status of sapcontrol.
 
@@ -164,6 +707,12 @@ def status(instance_number, username, password, fallback=True, fqdn=None, **kwar
         The fully qualified domain name on which the sapcontrol instance is running.
         If none is given, the FQDN of the current host is used. Default is ``None``.
 
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
     CLI Example:
 
     .. code-block:: bash
@@ -172,11 +721,14 @@ def status(instance_number, username, password, fallback=True, fqdn=None, **kwar
     """
     log.debug("Running function")
     client = _get_client(
+        timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
         instance_number=instance_number,
         username=username,
         password=password,
         fqdn=fqdn,
         fallback=fallback,
+        use_cache=False,
     )
     if not client:
         log.debug(f"sapcontrol not running on {fqdn}")
@@ -228,15 +780,23 @@ def start(sid, instance_number, username, password, timeout=60, **kwargs):
         log.error(f"Could not start sapcontrol:\n{out}")
         return False
 
-    running = False
-    now = time.time()
-    while time.time() < now + timeout:
-        if status(instance_number, username, password):
-            running = True
-            break
-        time.sleep(1)
+    # waiting for the port to open is a lot cheaper than setting up SOAP connections
+    deadline = time.time() + timeout
+    target = _normalize(instance_number)
+    fqdn = target.fqdn
+    https_port = HTTPS_PORT_BASE + 100 * target.nr
+    http_port = HTTP_PORT_BASE + 100 * target.nr
+    log.debug(f"Waiting for port {https_port} or {http_port} on {fqdn} to open")
+    if not _poll(
+        lambda: _port_open(fqdn, https_port) or _port_open(fqdn, http_port), timeout=timeout
+    ):
+        log.error(f"sapcontrol did not open its ports within {timeout} seconds")
+        return False
 
-    return running
+    return _poll(
+        lambda: status(instance_number, username, password),
+        timeout=max(deadline - time.time(), 0),
+    )
 
 
 # pylint: disable=unused-argument
@@ -275,11 +835,23 @@ def stop(instance_number, username, timeout=60, **kwargs):
         out = cmd_ret.get("stderr").strip()
         log.error(f"Could not stop sapcontrol:\n{out}")
         return False
+    target = _normalize(instance_number)
+    _evict_clients(target.fqdn, target.nr_str)
     return True
 
 
 # pylint: disable=unused-argument
-def restart(sid, instance_number, username, password, fallback=True, fqdn=None, **kwargs):
+def restart(
+    sid,
+    instance_number,
+    username,
+    password,
+    fallback=True,
+    fqdn=None,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
+):
     """
     Restarts sapcontrol for a given SID and instance number.
 
@@ -303,6 +875,12 @@ def restart(sid, instance_number, username, password, fallback=True, fqdn=None,
         The fully qualified domain name on which the sapcontrol instance is running.
         If none is given, the FQDN of the current host is used. Default is ``None``.
 
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
     CLI Example:
 
     .. code-block:: bash
@@ -312,11 +890,14 @@ def restart(sid, instance_number, username, password, fallback=True, fqdn=None,
     log.debug("Running function")
 
     client = _get_client(
+        timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
         instance_number=instance_number,
         username=username,
         password=password,
         fqdn=fqdn,
         fallback=fallback,
+        use_cache=False,
     )
     if not client:
         log.debug("sapcontrol is not running, starting")
@@ -335,7 +916,19 @@ def restart(sid, instance_number, username, password, fallback=True, fqdn=None,
 ### FUNCTIONS ########################################################################################################
 
 
-def instance_status(instance_number, username, password, fallback=True, fqdn=None, **kwargs):
+@_handle_connection_errors(SAPCONTROL_RED)
+def instance_status(
+    instance_number,
+    username,
+    password,
+    fallback=True,
+    fqdn=None,
+    local=None,
+    client=None,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
+):
     """
     Retrieves the status of an SAP instance based on the instance number.
 
@@ -362,66 +955,81 @@ def instance_status(instance_number, username, password, fallback=True, fqdn=Non
         The fully qualified domain name on which the sapcontrol instance is running.
         If none is given, the FQDN of the current host is used. Default is ``None``.
 
+    local
+        If set to ``True``, the status is derived from the process list of the instance instead of
+        the list of all system instances, which reduces the amount of data transferred. If
+        ``None``, the process list is used if the instance is running on the current host.
+        Default is ``None``.
+
+    client
+        Already established SOAP client for the instance to use instead of setting up a new
+        connection. Default is ``None``.
+
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
     CLI Example:
 
     .. code-block:: bash
 
         salt "*" sap_control.instance_status instance_number="00" username="sapadm" password="Abcd1234"
     """
-    if not fqdn:
-        fqdn = __grains__["fqdn"]
+    target = _normalize(instance_number, fqdn)
+    instance_number, fqdn = target.nr_str, target.fqdn
     log.debug(f"Running function for instance {instance_number} on {fqdn} with fallback={fallback}")
-    tgt_domain = "." + fqdn.split(".", 1)[1]
 
-    if isinstance(instance_number, int):
-        instance_number = format(instance_number, "02")
-
-    log.debug("Setting up connection to sapcontrol")
-    client = _get_client(
-        instance_number=instance_number,
-        username=username,
-        password=password,
-        fqdn=fqdn,
-        fallback=fallback,
-    )
     if not client:
-        return SAPCONTROL_RED
+        log.debug("Setting up connection to sapcontrol")
+        client = _get_client(
+            timeout=wsdl_timeout,
+            operation_timeout=operation_timeout,
+            instance_number=instance_number,
+            username=username,
+            password=password,
+            fqdn=fqdn,
+            fallback=fallback,
+            target=target,
+        )
+        if not client:
+            return SAPCONTROL_RED
+
+    if local is None:
+        local = fqdn == _local_fqdn()
+    if local:
+        log.debug(f"Retrieving processes of instance {instance_number}")
+        return _local_dispstatus(client)
 
     log.debug("Retrieving all instances")
-    instances = client.service.GetSystemInstanceList()
-    for instance in instances:
-        hostname = instance["hostname"] + tgt_domain
-        if hostname != fqdn:
-            continue
-        inst_number = format(instance["instanceNr"], "02")
-        if inst_number != instance_number:
-            continue
-        if instance["dispstatus"] == "SAPControl-GREEN":
-            log.debug(f"Instance {instance_number} on {fqdn} is running")
-            return SAPCONTROL_GREEN
-        elif instance["dispstatus"] == "SAPControl-YELLOW":
-            log.debug(f"Instance {instance_number} on {fqdn} is starting / stopping")
-            return SAPCONTROL_YELLOW
-        elif instance["dispstatus"] == "SAPControl-RED":
-            log.debug(f"Instance {instance_number} on {fqdn} is error")
-            return SAPCONTROL_RED
-        elif instance["dispstatus"] == "SAPControl-GRAY":
-            log.debug(f"instance_status:Instance {instance_number} on {fqdn} is stopped")
-            return SAPCONTROL_GRAY
-        else:
-            log.error(
-                f"Unknown status {instance['dispstatus']} for instance {instance_number} on {fqdn}"
-            )
-            raise Exception(
+    instance = _get_instances_by_key(client).get((target.host, instance_number))
+    if instance is not None:
+        ret = _DISPSTATUS_MAP.get(instance["dispstatus"])
+        if ret is None:
+            msg = (
                 f"Unknown status {instance['dispstatus']} for instance {instance_number} on {fqdn}"
             )
+            log.error(msg)
+            raise Exception(msg)
+        log.debug(f"Instance {instance_number} on {fqdn} has status {instance['dispstatus']}")
+        return ret
 
     log.warning(f"Cannot determine status of instance {instance_number} on {fqdn}")
     return SAPCONTROL_RED
 
 
+@_handle_connection_errors(False)
 def instance_start(
-    instance_number, username, password, fallback=True, fqdn=None, timeout=300, **kwargs
+    instance_number,
+    username,
+    password,
+    fallback=True,
+    fqdn=None,
+    timeout=300,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
 ):
     """
     Starts an SAP instance based on the instance number.
@@ -446,39 +1054,42 @@ def instance_start(
     timeout
         Timeout for the instance to start. Default is ``300``.
 
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
     CLI Example:
 
     .. code-block:: bash
 
         salt "*" sap_control.instance_start instance_number="00" username="sapadm" password="Abcd1234"
     """
-    if not fqdn:
-        fqdn = __grains__["fqdn"]
-    log.debug(
-        f"Running function for instance {instance_number:02d} on {fqdn} with fallback={fallback}"
-    )
-    tgt_host = fqdn.split(".", 1)[0]
-
-    if isinstance(instance_number, int):
-        instance_number = format(instance_number, "02")
+    target = _normalize(instance_number, fqdn)
+    instance_number, fqdn = target.nr_str, target.fqdn
+    log.debug(f"Running function for instance {instance_number} on {fqdn} with fallback={fallback}")
 
     log.debug("Setting up connection to sapcontrol")
     client = _get_client(
+        timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
         instance_number=instance_number,
         username=username,
         password=password,
         fqdn=fqdn,
         fallback=fallback,
+        target=target,
     )
     if not client:
         return SAPCONTROL_RED
 
     log.debug(f"Starting instance {instance_number} on {fqdn}")
-    client.service.InstanceStart(host=tgt_host, nr=int(instance_number))
+    client.service.InstanceStart(host=target.host, nr=target.nr)
 
     log.debug(f"Waiting for status == Running up to {timeout} seconds")
-    start_timeout = time.time() + timeout
-    while True:
+
+    def _is_running():
         log.debug(f"Checking instance status for {instance_number}")
         inst_status = instance_status(
             instance_number=instance_number,
@@ -486,12 +1097,14 @@ def instance_start(
             username=username,
             password=password,
             fallback=fallback,
+            local=True,
+            client=client,
         )
         if inst_status == SAPCONTROL_RED:
             log.error(f"Cannot determine status of instance {instance_number}")
         elif inst_status == SAPCONTROL_GREEN:
             log.debug(f"Instance {instance_number} is running, exiting")
-            break
+            return True
         elif inst_status == SAPCONTROL_YELLOW:
             log.debug(f"Instance {instance_number} is starting")
         elif inst_status == SAPCONTROL_GRAY:
@@ -499,18 +1112,28 @@ def instance_start(
         else:
             log.error(f"Unknown instance status {inst_status}")
             raise Exception(f"Unknown instance status {inst_status}")
-        if time.time() > start_timeout:
-            log.error(
-                f"Could not start instance {instance_number}, timeout of {timeout} seconds reached"
-            )
-            return False
-        time.sleep(1)
+        return False
+
+    if not _poll(_is_running, timeout=timeout):
+        log.error(
+            f"Could not start instance {instance_number}, timeout of {timeout} seconds reached"
+        )
+        return False
 
     return True
 
 
+@_handle_connection_errors(False)
 def instance_stop(
-    instance_number, username, password, fallback=True, fqdn=None, timeout=300, **kwargs
+    instance_number,
+    username,
+    password,
+    fallback=True,
+    fqdn=None,
+    timeout=300,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
 ):
     """
     Stops an SAP instance based on the instance number.
@@ -535,43 +1158,46 @@ def instance_stop(
     timeout
         Timeout for the instance to stop. Default is ``300``.
 
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
     CLI Example:
 
     .. code-block:: bash
 
         salt "*" sap_control.instance_stop instance_number="00" username="sapadm" password="Abcd1234"
     """
-    if not fqdn:
-        fqdn = __grains__["fqdn"]
-    log.debug(
-        f"Running function for instance {instance_number:02d} on {fqdn} with fallback={fallback}"
-    )
-    tgt_host = fqdn.split(".", 1)[0]
-
-    if isinstance(instance_number, int):
-        instance_number = format(instance_number, "02")
+    target = _normalize(instance_number, fqdn)
+    instance_number, fqdn = target.nr_str, target.fqdn
+    log.debug(f"Running function for instance {instance_number} on {fqdn} with fallback={fallback}")
 
     log.debug("Setting up connection to sapcontrol")
     client = _get_client(
+        timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
         instance_number=instance_number,
         username=username,
         password=password,
         fqdn=fqdn,
         fallback=fallback,
+        target=target,
     )
     if not client:
         return SAPCONTROL_RED
 
     log.debug(f"Stopping instance {instance_number} on {fqdn}")
     # this will only return something on error
-    result = client.service.InstanceStop(host=tgt_host, nr=int(instance_number), softtimeout=300)
+    result = client.service.InstanceStop(host=target.host, nr=target.nr, softtimeout=300)
     if result:
         log.error(f"Something went wrong:\n{result}")
         return False
 
     log.debug(f"Waiting for status == Stopped up to {timeout} seconds")
-    stop_timeout = time.time() + timeout
-    while True:
+
+    def _is_stopped():
         log.debug(f"Checking instance status for {instance_number}")
         inst_status = instance_status(
             instance_number=instance_number,
@@ -579,6 +1205,8 @@ def instance_stop(
             password=password,
             fqdn=fqdn,
             fallback=fallback,
+            local=True,
+            client=client,
         )
         if inst_status == SAPCONTROL_RED:
             log.error(f"Cannot determine status of instance {instance_number}")
@@ -588,20 +1216,22 @@ def instance_stop(
             log.debug(f"Instance {instance_number} is stopping")
         elif inst_status == SAPCONTROL_GRAY:
             log.debug(f"Instance {instance_number} is stopped, exiting")
-            break
+            return True
         else:
             log.error(f"Unknown instance status {inst_status}")
             raise Exception(f"Unknown instance status {inst_status}")
-        if time.time() > stop_timeout:
-            log.error(
-                f"Could not stop instance {instance_number}, timeout of {timeout} seconds reached"
-            )
-            return False
-        time.sleep(1)
+        return False
+
+    if not _poll(_is_stopped, timeout=timeout):
+        log.error(
+            f"Could not stop instance {instance_number}, timeout of {timeout} seconds reached"
+        )
+        return False
 
     return True
 
 
+@_handle_connection_errors(False)
 def system_start(
     instance_number,
     username,
@@ -610,6 +1240,8 @@ def system_start(
     fallback=True,
     fqdn=None,
     timeout=300,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
     **kwargs,
 ):
     """
@@ -642,6 +1274,12 @@ def system_start(
     .. note ::
         There is no implementation of WaitForStarted as a sapcontrol webservice.
 
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
     CLI Example:
 
     .. code-block:: bash
@@ -652,6 +1290,8 @@ def system_start(
 
     log.debug("Setting up connection to sapcontrol")
     client = _get_client(
+        timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
         instance_number=instance_number,
         username=username,
         password=password,
@@ -662,7 +1302,9 @@ def system_start(
         return False
 
     log.debug(f"Calling StartSystem on instance {instance_number} on {fqdn}")
-    result = client.service.StartSystem(
+    # the call blocks until the system is started, i.e. it takes longer than the default timeout
+    long_client = _with_operation_timeout(client, timeout + operation_timeout)
+    result = long_client.service.StartSystem(
         options=f"SAPControl-{level}-INSTANCES", waittimeout=timeout
     )
     # on success, the function doesn't return anything, on error / timeout the error is returned
@@ -673,6 +1315,7 @@ def system_start(
         return False
 
 
+@_handle_connection_errors(False)
 def system_stop(
     instance_number,
     username,
@@ -681,6 +1324,8 @@ def system_stop(
     fallback=True,
     fqdn=None,
     timeout=300,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
     **kwargs,
 ):
     """
@@ -713,6 +1358,12 @@ def system_stop(
     .. note ::
         There is no implementation of WaitForStarted as a sapcontrol webservice.
 
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
     CLI Example:
 
     .. code-block:: bash
@@ -723,6 +1374,8 @@ def system_stop(
 
     log.debug("Setting up connection to sapcontrol")
     client = _get_client(
+        timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
         instance_number=instance_number,
         username=username,
         password=password,
@@ -734,17 +1387,154 @@ def system_stop(
 
     log.debug(f"Calling StopSystem on instance {instance_number} on {fqdn}")
     # the function will only return something on error / timeout
-    result = client.service.StopSystem(
+    long_client = _with_operation_timeout(client, timeout + operation_timeout)
+    result = long_client.service.StopSystem(
         options=f"SAPControl-{level}-INSTANCES", waittimeout=timeout, softtimeout=timeout
     )
-    if result:
-        log.error(f"Could not stop {instance_number}:\n{result}")
-        return False
-    return True
+    if result:
+        log.error(f"Could not stop {instance_number}:\n{result}")
+        return False
+    return True
+
+
+def system_start_many(
+    targets,
+    username,
+    password,
+    level="ALL",
+    fallback=True,
+    timeout=300,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
+):
+    """
+    Starts multiple SAP systems in parallel with a certain level, see ``system_start``.
+    Returns a dictionary with the result for every target, e.g. ``{"host1.my.domain:00": True}``.
+    Errors of a single target only set its result to ``False``.
+
+    targets
+        List of dictionaries with the keys ``instance_number`` and ``fqdn``. All other arguments
+        can be overwritten per target.
+
+    username
+        Username to use for connecting to sapcontrol.
+
+    password
+        Password to use for connecting to sapcontrol.
+
+    level
+        Configuration of the systems to start, can be on of: ``ALL|SCS|DIALOG|ABAP|J2EE|TREX|ENQREP|HDB|ALLNOHDB``.
+        Default is ``ALL``.
+
+    fallback
+        If set to ``True``, a HTTP connection will be opened in case of HTTPS connection failures.
+        Default is ``True``.
+
+    timeout
+        Timeout for the systems to start. Default is ``300``.
+
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        salt "*" sap_control.system_start_many targets='[{"instance_number": "00", "fqdn": "s4h.my.domain"}, {"instance_number": "00", "fqdn": "bw4.my.domain"}]' username="sapadm" password="Abcd1234"
+    """  # pylint: disable=line-too-long
+    log.debug(f"Running function for {len(targets)} targets")
+    return _run_many(
+        system_start,
+        targets,
+        username=username,
+        password=password,
+        level=level,
+        fallback=fallback,
+        timeout=timeout,
+        wsdl_timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
+    )
+
+
+def system_stop_many(
+    targets,
+    username,
+    password,
+    level="ALL",
+    fallback=True,
+    timeout=300,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
+):
+    """
+    Stops multiple SAP systems in parallel with a certain level, see ``system_stop``.
+    Returns a dictionary with the result for every target, e.g. ``{"host1.my.domain:00": True}``.
+    Errors of a single target only set its result to ``False``.
+
+    targets
+        List of dictionaries with the keys ``instance_number`` and ``fqdn``. All other arguments
+        can be overwritten per target.
+
+    username
+        Username to use for connecting to sapcontrol.
+
+    password
+        Password to use for connecting to sapcontrol.
+
+    level
+        Configuration of the systems to stop, can be on of: ``ALL|SCS|DIALOG|ABAP|J2EE|TREX|ENQREP|HDB|ALLNOHDB``.
+        Default is ``ALL``.
+
+    fallback
+        If set to ``True``, a HTTP connection will be opened in case of HTTPS connection failures.
+        Default is ``True``.
+
+    timeout
+        Timeout for the systems to stop. Default is ``300``.
+
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        salt "*" sap_control.system_stop_many targets='[{"instance_number": "00", "fqdn": "s4h.my.domain"}, {"instance_number": "00", "fqdn": "bw4.my.domain"}]' username="sapadm" password="Abcd1234"
+    """  # pylint: disable=line-too-long
+    log.debug(f"Running function for {len(targets)} targets")
+    return _run_many(
+        system_stop,
+        targets,
+        username=username,
+        password=password,
+        level=level,
+        fallback=fallback,
+        timeout=timeout,
+        wsdl_timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
+    )
 
 
+@_handle_connection_errors(False)
 def get_system_instance_list(
-    instance_number, username, password, fallback=True, fqdn=None, timeout=300, **kwargs
+    instance_number,
+    username,
+    password,
+    fallback=True,
+    fqdn=None,
+    timeout=300,
+    include_properties=False,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
 ):
     """
     Retrieve a list of system instances on the host.
@@ -769,16 +1559,30 @@ def get_system_instance_list(
     timeout
         Timeout to retrieve the list of system instances. Default is ``300``.
 
+    include_properties
+        If set to ``True``, the properties of every instance are retrieved in parallel and added
+        under the key ``properties``. Default is ``False``.
+
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
     CLI Example:
 
     .. code-block:: bash
 
         salt "*" sap_control.get_system_instance_list instance_number="00" username="sapadm" password="Abcd1234"
     """
+    if not fqdn:
+        fqdn = _local_fqdn()
     log.debug(f"Running function for instance {instance_number} on {fqdn}")
 
     log.debug("Setting up connection to sapcontrol")
     client = _get_client(
+        timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
         instance_number=instance_number,
         username=username,
         password=password,
@@ -789,25 +1593,54 @@ def get_system_instance_list(
         return False
 
     log.debug(f"Retrieving list of instances for instance {instance_number} on {fqdn}")
-    result = client.service.GetSystemInstanceList(timeout=timeout)
+    long_client = _with_operation_timeout(client, timeout + operation_timeout)
+    result = long_client.service.GetSystemInstanceList(timeout=timeout)
     if not result:
         log.error(f"Something went wrong:\n{result}")
         return False
-    ret = []
-    for instance in result:
-        ret.append(
-            {
-                "hostname": instance["hostname"],
-                "instance": instance["instanceNr"],
-                "start_priority": float(instance["startPriority"]),
-                "features": instance["features"].split("|"),
-            }
+    ret = [
+        {
+            "hostname": hostname,
+            "instance": instance_nr,
+            "start_priority": float(start_priority),
+            "features": features.split("|"),
+        }
+        for hostname, instance_nr, start_priority, features in map(_INSTANCE_FIELDS, result)
+    ]
+
+    if include_properties:
+        log.debug(f"Retrieving properties of {len(ret)} instances")
+        tgt_domain = "." + fqdn.split(".", 1)[1] if "." in fqdn else ""
+        properties = _parallel_map(
+            get_instance_properties,
+            [
+                {
+                    "instance_number": instance["instance"],
+                    "username": username,
+                    "password": password,
+                    "fallback": fallback,
+                    "fqdn": instance["hostname"] + tgt_domain,
+                    "wsdl_timeout": wsdl_timeout,
+                    "operation_timeout": operation_timeout,
+                }
+                for instance in ret
+            ],
         )
+        for instance, props in zip(ret, properties):
+            instance["properties"] = props
     return ret
 
 
+@_handle_connection_errors(False)
 def get_instance_properties(
-    instance_number, username, password, fallback=True, fqdn=None, **kwargs
+    instance_number,
+    username,
+    password,
+    fallback=True,
+    fqdn=None,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
 ):
     """
     Retrieve the properties for an SAP instance.
@@ -829,6 +1662,12 @@ def get_instance_properties(
         The fully qualified domain name on which the sapcontrol instance is running.
         If none is given, the FQDN of the current host is used. Default is ``None``.
 
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
     CLI Example:
 
     .. code-block:: bash
@@ -839,6 +1678,8 @@ def get_instance_properties(
 
     log.debug("Setting up connection to sapcontrol")
     client = _get_client(
+        timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
         instance_number=instance_number,
         username=username,
         password=password,
@@ -853,14 +1694,20 @@ def get_instance_properties(
     if not result:
         log.error(f"Something went wrong:\n{result}")
         return False
-    ret = {}
-    for prop in result:
-        ret[prop["property"]] = prop["value"]
-    return ret
+    return {prop["property"]: prop["value"] for prop in result}
 
 
+@_handle_connection_errors((False, None))
 def parameter_value(
-    instance_number, parameter, username, password, fallback=True, fqdn=None, **kwargs
+    instance_number,
+    parameter,
+    username,
+    password,
+    fallback=True,
+    fqdn=None,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
 ):
     """
     Retrieve a parameter value from an SAP instance. Will return ``(Success, Data)``,
@@ -886,6 +1733,12 @@ def parameter_value(
         The fully qualified domain name on which the sapcontrol instance is running.
         If none is given, the FQDN of the current host is used. Default is ``None``.
 
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
     CLI Example:
 
     .. code-block:: bash
@@ -896,6 +1749,8 @@ def parameter_value(
 
     log.debug("Setting up connection to sapcontrol")
     client = _get_client(
+        timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
         instance_number=instance_number,
         username=username,
         password=password,
@@ -925,8 +1780,16 @@ def parameter_value(
     return True, result
 
 
+@_handle_connection_errors((False, None))
 def get_abap_component_list(
-    instance_number, username, password, fallback=True, fqdn=None, **kwargs
+    instance_number,
+    username,
+    password,
+    fallback=True,
+    fqdn=None,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
 ):
     """
     Retrieve a list of ABAP components of a system.
@@ -951,6 +1814,12 @@ def get_abap_component_list(
         The fully qualified domain name on which the sapcontrol instance is running.
         If none is given, the FQDN of the current host is used. Default is ``None``.
 
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
     CLI Example:
 
     .. code-block:: bash
@@ -961,6 +1830,8 @@ def get_abap_component_list(
 
     log.debug("Setting up connection to sapcontrol")
     client = _get_client(
+        timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
         instance_number=instance_number,
         username=username,
         password=password,
@@ -981,10 +1852,9 @@ def get_abap_component_list(
     if not result:
         log.error(f"Something went wrong:\n{result}")
         return False, None
-    log.trace(f"Got result:\n{result}")
-    data = {}
-    for comp in result:
-        data[comp["component"]] = {
+    log.trace("Got result:\n%s", result)
+    data = {
+        comp["component"]: {
             "version": comp["release"],
             "support_packages": comp["patchlevel"],
             "patch_level": "N/A",
@@ -992,16 +1862,28 @@ def get_abap_component_list(
             "type": comp["componenttype"],
             "description": comp["description"],
         }
+        for comp in result
+    }
     return True, data
 
 
-def process_status(
-    instance_number, process_name, username, password, fallback=True, fqdn=None, **kwargs
+@_handle_connection_errors(_per_process(SAPCONTROL_RED))
+def process_statuses(
+    instance_number,
+    process_names,
+    username,
+    password,
+    fallback=True,
+    fqdn=None,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
 ):
     """
-    Retrieves the status of a process of an SAP instance.
+    Retrieves the status of multiple processes of an SAP instance with a single call.
+    Returns a dictionary with the status for every process name.
 
-    Returns one of the following status:
+    The status is one of the following:
         SAPCONTROL_GRAY     = 1     => process stopped
         SAPCONTROL_GREEN    = 2     => process running
         SAPCONTROL_YELLOW   = 3     => process starting / stopping
@@ -1010,8 +1892,8 @@ def process_status(
     instance_number
         Instance number for the sapcontrol instance.
 
-    process_name
-        Name of the process for which the status should be retrieved.
+    process_names
+        List of process names for which the status should be retrieved.
 
     username
         Username to use for connecting to sapcontrol.
@@ -1027,23 +1909,32 @@ def process_status(
         The fully qualified domain name on which the sapcontrol instance is running.
         If none is given, the FQDN of the current host is used. Default is ``None``.
 
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
     CLI Example:
 
     .. code-block:: bash
 
-        salt "*" sap_control.process_status instance_number="00" process_name="webdisp" username="sapadm" password="Abcd1234"
+        salt "*" sap_control.process_statuses instance_number="00" process_names='["disp+work", "igswd_mt"]' username="sapadm" password="Abcd1234"
     """  # pylint: disable=line-too-long
     if not fqdn:
-        fqdn = __grains__["fqdn"]
+        fqdn = _local_fqdn()
+    if isinstance(process_names, str):
+        process_names = [process_names]
     log.debug(
-        f"Running function for process {process_name} of instance {instance_number} on {fqdn} with fallback={fallback}"
+        f"Running function for processes {process_names} of instance {instance_number} on {fqdn} with fallback={fallback}"
     )
 
-    if isinstance(instance_number, int):
-        instance_number = format(instance_number, "02")
+    instance_number = _norm_instance(instance_number)
 
     log.debug("Setting up connection to sapcontrol")
     client = _get_client(
+        timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
         instance_number=instance_number,
         username=username,
         password=password,
@@ -1051,59 +1942,63 @@ def process_status(
         fallback=fallback,
     )
     if not client:
-        return SAPCONTROL_RED
+        return {process_name: SAPCONTROL_RED for process_name in process_names}
 
     log.debug(f"Retrieving all processes of instance {instance_number}")
-    processes = client.service.GetProcessList()
-    for process in processes:
-        if process["name"] != process_name:
-            continue
-        if process["dispstatus"] == "SAPControl-GREEN":
-            log.debug(f"Process {process_name} of instance {instance_number} on {fqdn} is running")
-            return SAPCONTROL_GREEN
-        elif process["dispstatus"] == "SAPControl-YELLOW":
-            log.debug(
-                f"Process {process_name} of instance {instance_number} on {fqdn} is starting / stopping"
+    processes = _find_processes(client, process_names)
+    ret = {}
+    for process_name in process_names:
+        process = processes.get(process_name)
+        if process is None:
+            log.warning(
+                f"Cannot determine status of process {process_name} of instance {instance_number} on {fqdn}"
             )
-            return SAPCONTROL_YELLOW
-        elif process["dispstatus"] == "SAPControl-RED":
-            log.debug(f"Process {process_name} of instance {instance_number} on {fqdn} is error")
-            return SAPCONTROL_RED
-        elif process["dispstatus"] == "SAPControl-GRAY":
-            log.debug(f"Process {process_name} of instance {instance_number} on {fqdn} is stopped")
-            return SAPCONTROL_GRAY
-        else:
+            ret[process_name] = SAPCONTROL_RED
+            continue
+        status = _DISPSTATUS_MAP.get(process["dispstatus"])
+        if status is None:
             msg = (
                 f"Unknown status {process['dispstatus']} for process {process_name} "
                 f"of instance {instance_number} on {fqdn}"
             )
             log.error(msg)
             raise Exception(msg)
-
-    log.warning(
-        f"Cannot determine status of process {process_name} of instance {instance_number} on {fqdn}"
-    )
-    return SAPCONTROL_RED
+        log.debug(
+            "Process %s of instance %s on %s has status %s",
+            process_name,
+            instance_number,
+            fqdn,
+            process["dispstatus"],
+        )
+        ret[process_name] = status
+    return ret
 
 
-def get_pid(
+def process_status(
     instance_number,
     process_name,
     username,
     password,
     fallback=True,
     fqdn=None,
-    timeout=300,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
     **kwargs,
 ):
     """
-    Retrieves the PID of an Process of an SAP instance.
+    Retrieves the status of a process of an SAP instance.
+
+    Returns one of the following status:
+        SAPCONTROL_GRAY     = 1     => process stopped
+        SAPCONTROL_GREEN    = 2     => process running
+        SAPCONTROL_YELLOW   = 3     => process starting / stopping
+        SAPCONTROL_RED      = 4     => process error
 
     instance_number
         Instance number for the sapcontrol instance.
 
     process_name
-        Name of the process for which the pid should be retrieved.
+        Name of the process for which the status should be retrieved.
 
     username
         Username to use for connecting to sapcontrol.
@@ -1119,23 +2014,92 @@ def get_pid(
         The fully qualified domain name on which the sapcontrol instance is running.
         If none is given, the FQDN of the current host is used. Default is ``None``.
 
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
     CLI Example:
 
     .. code-block:: bash
 
-        salt "*" sap_control.get_pid instance_number="00" process_name="webdisp" username="sapadm" password="Abcd1234"
+        salt "*" sap_control.process_status instance_number="00" process_name="webdisp" username="sapadm" password="Abcd1234"
+    """  # pylint: disable=line-too-long
+    return process_statuses(
+        instance_number=instance_number,
+        process_names=[process_name],
+        username=username,
+        password=password,
+        fallback=fallback,
+        fqdn=fqdn,
+        wsdl_timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
+    )[process_name]
+
+
+@_handle_connection_errors(_per_process(False))
+def get_pids(
+    instance_number,
+    process_names,
+    username,
+    password,
+    fallback=True,
+    fqdn=None,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
+):
     """
+    Retrieves the PIDs of multiple processes of an SAP instance with a single call.
+    Returns a dictionary with the PID for every process name (``False`` if it cannot be determined).
+
+    instance_number
+        Instance number for the sapcontrol instance.
+
+    process_names
+        List of process names for which the PIDs should be retrieved.
+
+    username
+        Username to use for connecting to sapcontrol.
+
+    password
+        Password to use for connecting to sapcontrol.
+
+    fallback
+        If set to ``True``, a HTTP connection will be opened in case of HTTPS connection failures.
+        Default is ``True``.
+
+    fqdn
+        The fully qualified domain name on which the sapcontrol instance is running.
+        If none is given, the FQDN of the current host is used. Default is ``None``.
+
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        salt "*" sap_control.get_pids instance_number="00" process_names='["disp+work", "igswd_mt"]' username="sapadm" password="Abcd1234"
+    """  # pylint: disable=line-too-long
     if not fqdn:
-        fqdn = __grains__["fqdn"]
+        fqdn = _local_fqdn()
+    if isinstance(process_names, str):
+        process_names = [process_names]
     log.debug(
-        f"Running function for process {process_name} of instance {instance_number} on {fqdn} with fallback={fallback}"
+        f"Running function for processes {process_names} of instance {instance_number} on {fqdn} with fallback={fallback}"
     )
 
-    if isinstance(instance_number, int):
-        instance_number = format(instance_number, "02")
+    instance_number = _norm_instance(instance_number)
 
     log.debug("Setting up connection to sapcontrol")
     client = _get_client(
+        timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
         instance_number=instance_number,
         username=username,
         password=password,
@@ -1143,24 +2107,85 @@ def get_pid(
         fallback=fallback,
     )
     if not client:
-        return False
+        return {process_name: False for process_name in process_names}
 
     log.debug(f"Retrieving all processes of instance {instance_number}")
-    processes = client.service.GetProcessList()
-    for process in processes:
-        if process["name"] == process_name:
-            log.debug(f"PID of process {process_name} is {process['pid']}")
-            return process["pid"]
-        else:
+    processes = _find_processes(client, process_names)
+    ret = {}
+    for process_name in process_names:
+        process = processes.get(process_name)
+        if process is None:
+            log.warning(
+                f"Cannot determine the PID of process {process_name} of instance {instance_number} on {fqdn}"
+            )
+            ret[process_name] = False
             continue
+        log.debug("PID of process %s is %s", process_name, process["pid"])
+        ret[process_name] = process["pid"]
+    return ret
 
-    log.warning(
-        f"Cannot determine the PID of process {process_name} of instance {instance_number} on {fqdn}"
-    )
-    return False
+
+def get_pid(
+    instance_number,
+    process_name,
+    username,
+    password,
+    fallback=True,
+    fqdn=None,
+    timeout=300,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
+):
+    """
+    Retrieves the PID of an Process of an SAP instance.
+
+    instance_number
+        Instance number for the sapcontrol instance.
+
+    process_name
+        Name of the process for which the pid should be retrieved.
+
+    username
+        Username to use for connecting to sapcontrol.
+
+    password
+        Password to use for connecting to sapcontrol.
+
+    fallback
+        If set to ``True``, a HTTP connection will be opened in case of HTTPS connection failures.
+        Default is ``True``.
+
+    fqdn
+        The fully qualified domain name on which the sapcontrol instance is running.
+        If none is given, the FQDN of the current host is used. Default is ``None``.
+
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        salt "*" sap_control.get_pid instance_number="00" process_name="webdisp" username="sapadm" password="Abcd1234"
+    """
+    return get_pids(
+        instance_number=instance_number,
+        process_names=[process_name],
+        username=username,
+        password=password,
+        fallback=fallback,
+        fqdn=fqdn,
+        wsdl_timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
+    )[process_name]
 
 
 # pylint: disable=dangerous-default-value
+@_handle_connection_errors(False)
 def get_syslog_errors(
     timestamp_from,
     instance_number,
@@ -1169,6 +2194,8 @@ def get_syslog_errors(
     severities=["SAPControl-RED"],
     fallback=True,
     fqdn=None,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
     **kwargs,
 ):
     """
@@ -1201,6 +2228,12 @@ def get_syslog_errors(
         The fully qualified domain name on which the sapcontrol instance is running.
         If none is given, the FQDN of the current host is used. Default is ``None``.
 
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
     CLI Example:
 
     .. code-block:: bash
@@ -1208,17 +2241,18 @@ def get_syslog_errors(
         salt "*" sap_control.get_syslog_errors timestamp_from="2022-12-31 14:59:38" instance_number="00" username="sapadm" password="Abcd1234"
     """  # pylint: disable=line-too-long
     if not fqdn:
-        fqdn = __grains__["fqdn"]
+        fqdn = _local_fqdn()
     log.debug("Running function")
 
-    if isinstance(instance_number, int):
-        instance_number = format(instance_number, "02")
+    instance_number = _norm_instance(instance_number)
 
     if isinstance(timestamp_from, str):
         timestamp_from = dt.strptime(timestamp_from, "%Y-%m-%d %H:%M:%S")
 
     log.debug("Setting up connection to sapcontrol")
     client = _get_client(
+        timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
         instance_number=instance_number,
         username=username,
         password=password,
@@ -1228,19 +2262,36 @@ def get_syslog_errors(
     if not client:
         return False
 
-    log.debug(f"Retrieving all processes of instance {instance_number}")
+    log.debug(f"Retrieving syslog of instance {instance_number}")
     syslog = client.service.ABAPReadSyslog()
+    if isinstance(severities, str):
+        severities = [severities]
+    severities = frozenset(severities)
+    # comparing integer tuples is a lot faster than creating datetime objects with strptime
+    threshold = timestamp_from.timetuple()[:6]
     relevant_syslog = []
-    for entry in syslog:
-        syslog_timestamp = dt.strptime(entry.Time, "%Y %m %d %H:%M:%S")
-        if syslog_timestamp > timestamp_from and entry.Severity in severities:
+    for entry in syslog or []:
+        if entry.Severity not in severities:
+            continue
+        match = _SYSLOG_TIME_RE.match(entry.Time)
+        if match and tuple(map(int, match.groups())) > threshold:
             relevant_syslog.append(entry)
-    log.trace(f"Retrieved the following relevant syslog entries: {relevant_syslog}")
+    log.trace("Retrieved the following relevant syslog entries: %s", relevant_syslog)
     return relevant_syslog
 
 
 # pylint: disable=dangerous-default-value
-def get_workprocess_table(instance_number, username, password, fallback=True, fqdn=None, **kwargs):
+@_handle_connection_errors(False)
+def get_workprocess_table(
+    instance_number,
+    username,
+    password,
+    fallback=True,
+    fqdn=None,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
+):
     """
     Retrieves the current workprocess table for a given instance.
 
@@ -1264,6 +2315,12 @@ def get_workprocess_table(instance_number, username, password, fallback=True, fq
         The fully qualified domain name on which the sapcontrol instance is running.
         If none is given, the FQDN of the current host is used. Default is ``None``.
 
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
     CLI Example:
 
     .. code-block:: bash
@@ -1271,14 +2328,15 @@ def get_workprocess_table(instance_number, username, password, fallback=True, fq
         salt "*" sap_control.get_workprocess_table instance_number="00" username="sapadm" password="Abcd1234"
     """
     if not fqdn:
-        fqdn = __grains__["fqdn"]
+        fqdn = _local_fqdn()
     log.debug("Running function")
 
-    if isinstance(instance_number, int):
-        instance_number = format(instance_number, "02")
+    instance_number = _norm_instance(instance_number)
 
     log.debug("Setting up connection to sapcontrol")
     client = _get_client(
+        timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
         instance_number=instance_number,
         username=username,
         password=password,
@@ -1290,3 +2348,103 @@ def get_workprocess_table(instance_number, username, password, fallback=True, fq
 
     log.debug(f"Retrieving all processes of instance {instance_number}")
     return client.service.ABAPGetSystemWPTable() or []
+
+
+# pylint: disable=dangerous-default-value
+@_handle_connection_errors(False)
+def get_system_health(
+    timestamp_from,
+    instance_number,
+    username,
+    password,
+    severities=["SAPControl-RED"],
+    fallback=True,
+    fqdn=None,
+    wsdl_timeout=TIMEOUT,
+    operation_timeout=OPERATION_TIMEOUT,
+    **kwargs,
+):
+    """
+    Retrieves the syslog entries and the workprocess table for a given instance concurrently.
+    Returns a dictionary with the keys ``syslog_errors`` (see ``get_syslog_errors``) and
+    ``workprocess_table`` (see ``get_workprocess_table``).
+
+    .. note::
+        This of only works for SAP NetWeaver AS ABAP instances.
+
+    timestamp_from
+        Timestamp from which syslog entries should be retrieved. Must be a datetime object or a string
+        in the format ``%Y-%m-%d %H:%M:%S``.
+
+    instance_number
+        Instance number for the sapcontrol instance.
+
+    username
+        Username to use for connecting to sapcontrol.
+
+    password
+        Password to use for connecting to sapcontrol.
+
+    severities
+        List of severities for which syslog entries should be retrieved. By default, this list only
+        contains ``SAPControl-RED``
+
+    fallback
+        If set to ``True``, a HTTP connection will be opened in case of HTTPS connection failures.
+        Default is ``True``.
+
+    fqdn
+        The fully qualified domain name on which the sapcontrol instance is running.
+        If none is given, the FQDN of the current host is used. Default is ``None``.
+
+    wsdl_timeout
+        Timeout in seconds for loading the WSDL of sapcontrol. Default is ``30``.
+
+    operation_timeout
+        Timeout in seconds for SOAP operations. Default is ``60``.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        salt "*" sap_control.get_system_health timestamp_from="2022-12-31 14:59:38" instance_number="00" username="sapadm" password="Abcd1234"
+    """  # pylint: disable=line-too-long
+    if not fqdn:
+        fqdn = _local_fqdn()
+    log.debug("Running function")
+
+    # set up the client once so that both calls share the cached connection
+    log.debug("Setting up connection to sapcontrol")
+    client = _get_client(
+        timeout=wsdl_timeout,
+        operation_timeout=operation_timeout,
+        instance_number=instance_number,
+        username=username,
+        password=password,
+        fqdn=fqdn,
+        fallback=fallback,
+    )
+    if not client:
+        return False
+
+    common = {
+        "instance_number": instance_number,
+        "username": username,
+        "password": password,
+        "fallback": fallback,
+        "fqdn": fqdn,
+        "wsdl_timeout": wsdl_timeout,
+        "operation_timeout": operation_timeout,
+    }
+    # not using _parallel_map() on purpose: exceptions must propagate here, since a syslog that
+    # could not be read would be returned as False, which reads like "no syslog errors"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        syslog_future = executor.submit(
+            contextvars.copy_context().run,
+            get_syslog_errors,
+            timestamp_from=timestamp_from,
+            severities=severities,
+            **common,
+        )
+        wp_future = executor.submit(contextvars.copy_context().run, get_workprocess_table, **common)
+    return {"syslog_errors": syslog_future.result(), "workprocess_table": wp_future.result()}
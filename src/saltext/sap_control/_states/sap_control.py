@@ -17,11 +17,21 @@ This module implements states that utilize sapcontrol functionality.
     This module can only run on linux platforms.
 """
 import logging
+import operator
 import os
 import re
 import time
+from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as dt
 
+# contextvars is only available in Python >= 3.7
+CONTEXTVARSLIB = True
+try:
+    import contextvars
+except ImportError:
+    CONTEXTVARSLIB = None
+
 
 # Globals
 log = logging.getLogger(__name__)
@@ -30,28 +40,82 @@ log = logging.getLogger(__name__)
 NON_CRITICAL_SYSLOG_ERRORS = [
     'Monitoring: Program RSUSR003 Reports "Security check passed" ',
 ]
+_NON_CRITICAL = frozenset(NON_CRITICAL_SYSLOG_ERRORS)
+
+_RE_RETURN_CODE = re.compile(r"Return code: ([0-9]{3})")
+_RE_WS = re.compile(r" +")
+
+# connection parameters in the output of sldreg -showconnect
+_SLDREG_PARAMS = frozenset(["host_param", "https_param", "port_param", "user_param"])
+
+# fields of a work process table entry used in system_health_ok()
+_WP_FIELDS = operator.itemgetter("Status", "Err", "Reason", "Typ", "No", "Pid")
 
 __virtualname__ = "sap_control"
 
 
 def __virtual__():
+    if not CONTEXTVARSLIB:
+        return False, "Could not load sap_control state, contextvars unavailable"
     return __virtualname__
 
 
+# successful lookups of _which() by (executable, runas)
+_WHICH_CACHE = {}
+
+
 def _which(executable, runas=None):
     """
     Similar to salt.utils.path.which(), but:
      - Only works on Linux
      - Allows runas
+     - Found executables are cached, use ``_which.cache_clear()`` to reset the cache
 
     If not runas is given, the salt minion user is used
     """
+    key = (executable, runas)
+    path = _WHICH_CACHE.get(key)
+    if path:
+        return path
     ret = __salt__["cmd.run_all"](cmd=f"which {executable}", runas=runas)
     if ret["retcode"]:
         return None
+    _WHICH_CACHE[key] = ret["stdout"]
     return ret["stdout"]
 
 
+_which.cache_clear = _WHICH_CACHE.clear
+
+
+def _parse_showconnect(output):
+    """
+    Parses the output of ``sldreg -showconnect`` into a dictionary with the connection parameters
+    ``host_param``, ``https_param``, ``port_param`` and ``user_param`` (if present).
+    """
+    config = {}
+    for line in output.splitlines():
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if sep and key in _SLDREG_PARAMS:
+            config[key] = value.strip().strip("'")
+    return config
+
+
+def _log_file_success(log_file):
+    """
+    Returns ``True`` if the last return code in the log file is HTTP 200.
+    """
+    log.debug("Checking %s", log_file)
+    try:
+        log_file_data = __salt__["file.read"](log_file)
+    except FileNotFoundError:
+        log.debug("%s does not (yet?) exist", log_file)
+        return False
+    return_codes = _RE_RETURN_CODE.findall(log_file_data)
+    log.debug("Got result from checkup: %s", return_codes)
+    return bool(return_codes) and int(return_codes[-1]) == 200
+
+
 # pylint: disable=unused-argument
 def running(name, instance, username, password, restart=False, **kwargs):
     """
@@ -250,6 +314,9 @@ def sld_registered(
     remove_logs=True,
     overwrite=False,
     sld_check_timeout=60,
+    poll_interval=0.5,
+    poll_backoff=1.5,
+    poll_max=2.0,
     **kwargs,
 ):
     """
@@ -296,6 +363,15 @@ def sld_registered(
         How long the system will wait for a positive HTTP return code from the SLD in the defined logs.
         Default is ``60``.
 
+    poll_interval
+        Initial interval in seconds between two checks of the log files. Default is ``0.5``.
+
+    poll_backoff
+        Factor by which the interval is increased after every unsuccessful check. Default is ``1.5``.
+
+    poll_max
+        Maximum interval in seconds between two checks of the log files. Default is ``2.0``.
+
     .. warning::
         In order to trigger the data transfer, sapcontrol will be restarted!
 
@@ -354,17 +430,11 @@ def sld_registered(
         if result["retcode"]:
             return False
         log.debug("Parse output")
-        existing_config = {}
-        for line in result["stdout"]:
-            for param in ["host_param", "https_param", "port_param", "user_param"]:
-                if param in line:
-                    line_idx = line.find(param)
-                    key, value = line[line_idx:].split("=", 1)
-                    existing_config[key] = value.strip("'")
+        existing_config = _parse_showconnect(result["stdout"])
         if (
             sld_user == existing_config.get("user_param", None)
             and sld_host == existing_config.get("host_param", None)
-            and sld_port == existing_config.get("port_param", None)
+            and str(sld_port) == existing_config.get("port_param", None)
             and "y" == existing_config.get("https_param", None)
         ):
             update_cfg = False
@@ -433,24 +503,25 @@ def sld_registered(
             log.debug("Checking log files for success")
             # wait max. n seconds for the registration to happen
             timeout = time.time() + sld_check_timeout
-            re_rc = re.compile(r"Return code: ([0-9]{3})")
-            while time.time() < timeout:
-                all_success = True
-                for log_file in log_files:
-                    log.debug(f"Checking {log_file}")
-                    try:
-                        log_file_data = __salt__["file.read"](log_file)
-                    except FileNotFoundError:
-                        log.debug(f"{log_file} does not (yet?) exist")
-                        all_success = False
+            # log files are read concurrently, files that already show success are not read again
+            pending = set(log_files)
+            interval = poll_interval
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                while time.time() < timeout:
+                    futures = {
+                        executor.submit(
+                            contextvars.copy_context().run, _log_file_success, log_file
+                        ): log_file
+                        for log_file in pending
+                    }
+                    for future in as_completed(futures):
+                        if future.result():
+                            pending.discard(futures[future])
+                    if not pending:
                         break
-                    return_codes = re_rc.findall(log_file_data)
-                    log.debug(f"Got result from checkup: {return_codes}")
-                    if not return_codes or int(return_codes[-1]) != 200:
-                        all_success = False
-                if all_success:
-                    break
-                time.sleep(0.5)
+                    time.sleep(max(min(interval, timeout - time.time()), 0))
+                    interval = min(interval * poll_backoff, poll_max)
+            all_success = not pending
 
     if all_success:
         if log_files:
@@ -513,51 +584,54 @@ def system_health_ok(name, check_from, instance_number, username, password, **kw
         "name": name,
         "changes": {},
         "result": False,
-        "comment": [],
+        "comment": "",
     }
+    msgs = []
     from_datetime = dt.strptime(f"{check_from}000000", "%d%m%Y%H%M%S")
 
-    log.debug("Checking system log")
-    syslog_errors = __salt__["sap_control.get_syslog_errors"](
+    log.debug("Retrieving system log and work process table")
+    health = __salt__["sap_control.get_system_health"](
         timestamp_from=from_datetime,
         instance_number=instance_number,
         username=username,
         password=password,
     )
-    processed_errors = []
+    if not health:
+        msg = "Cannot retrieve system health data"
+        log.error(msg)
+        ret["comment"] = msg
+        return ret
+
+    log.debug("Checking system log")
+    syslog_errors = health["syslog_errors"]
+    processed_errors = set()
     if syslog_errors:
         log.error("Syslog errors:")
         for err in syslog_errors:
             # skip non-critical errors
-            if err.Text in NON_CRITICAL_SYSLOG_ERRORS:
+            if err.Text in _NON_CRITICAL:
                 continue
             log.error(err)
-            processed_errors.append(re.sub(" +", " ", f"SM21: {err.Text}"))
-    ret["comment"] += list(set(processed_errors))
+            processed_errors.add(_RE_WS.sub(" ", f"SM21: {err.Text}"))
+    msgs.extend(processed_errors)
 
     log.debug("Checking for work process errors")
-    wp_table = __salt__["sap_control.get_workprocess_table"](
-        instance_number=instance_number,
-        username=username,
-        password=password,
-    )
+    wp_table = health["workprocess_table"]
     if not isinstance(wp_table, list):
         msg = "Cannot retrieve workprocess table"
         log.error(msg)
-        ret["comment"].append(msg)
-    for wproc in wp_table:
-        if wproc.Status == "Ended" or wproc.Err:
-            reason = f" (reason: {wproc.Reason})" if wproc.Reason else ""
-            msg = (
-                f"SM50: {wproc.Typ} work process {wproc.No} (PID: {wproc.Pid}) is in "
-                f"status {wproc.Status}{reason} with error '{wproc.Err}'"
-            )
-            log.error(msg)
-            ret["comment"].append(msg)
-
-    if ret["comment"]:
-        ret["result"] = False
+        msgs.append(msg)
     else:
-        ret["comment"] = "System health OK"
-        ret["result"] = True
+        for status, err, reason, typ, no, pid in map(_WP_FIELDS, wp_table):
+            if status == "Ended" or err:
+                reason = f" (reason: {reason})" if reason else ""
+                msg = (
+                    f"SM50: {typ} work process {no} (PID: {pid}) is in "
+                    f"status {status}{reason} with error '{err}'"
+                )
+                log.error(msg)
+                msgs.append(msg)
+
+    ret["result"] = not msgs
+    ret["comment"] = "\n".join(msgs) if msgs else "System health OK"
     return ret
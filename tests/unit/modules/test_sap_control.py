@@ -0,0 +1,220 @@
+"""
+Unit tests for the sap_control execution module
+"""
+import datetime
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+import saltext.sap_control._modules.sap_control as sap_control_module
+from zeep.cache import InMemoryCache
+from zeep.exceptions import Fault
+
+
+@pytest.fixture
+def configure_loader_modules():
+    return {
+        sap_control_module: {
+            "__salt__": {"config.get": lambda key, default=None: default},
+            "__grains__": {"fqdn": "sap.my.domain"},
+            "__opts__": {},
+        }
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    sap_control_module._close_clients()  # pylint: disable=protected-access
+    with patch.object(sap_control_module, "_get_wsdl_cache", return_value=InMemoryCache()):
+        yield
+    sap_control_module._close_clients()  # pylint: disable=protected-access
+
+
+def test_process_status_wrong_credentials():
+    """
+    Test that a client with wrong credentials is not used, even if it was created without
+    downloading the WSDL
+    """
+    client = MagicMock()
+    client.service.GetProcessList.side_effect = Fault("Invalid Credentials")
+    with patch.object(sap_control_module, "_port_open", return_value=True), patch.object(
+        sap_control_module, "Client", return_value=client
+    ), patch("salt.utils.http.get_ca_bundle", return_value=True):
+        ret = sap_control_module.process_status(
+            "00", "disp+work", "sapadm", "WRONG", fqdn="sap.my.domain"
+        )
+    assert ret == sap_control_module.SAPCONTROL_RED
+    assert not sap_control_module._CLIENT_CACHE  # pylint: disable=protected-access
+
+
+def test_get_client_ssl_error_falls_back_to_http():
+    """
+    Test that a certificate error of a client created from cached data triggers the HTTP fallback
+    """
+    https_client = MagicMock()
+    https_client.service.GetProcessList.side_effect = sap_control_module.SSLError(
+        "certificate verify failed"
+    )
+    http_client = MagicMock()
+    with patch.object(sap_control_module, "_port_open", return_value=True), patch.object(
+        sap_control_module, "Client", side_effect=[https_client, http_client]
+    ), patch("salt.utils.http.get_ca_bundle", return_value=True):
+        client = sap_control_module._get_client(  # pylint: disable=protected-access
+            "00", "sapadm", "Abcd1234", fqdn="sap.my.domain"
+        )
+    assert client is http_client
+
+
+def test_get_client_http_fallback_expires():
+    """
+    Test that HTTPS is tried again once the cached HTTP fallback client expired
+    """
+    key = ("sap.my.domain", "00", "sapadm", "Abcd1234", "http", 60)
+    http_client = MagicMock()
+    https_client = MagicMock()
+    sap_control_module._CLIENT_CACHE[key] = http_client  # pylint: disable=protected-access
+    sap_control_module._FALLBACK_EXPIRY[key] = 0  # pylint: disable=protected-access
+    with patch.object(sap_control_module, "_port_open", return_value=True), patch.object(
+        sap_control_module, "Client", return_value=https_client
+    ), patch("salt.utils.http.get_ca_bundle", return_value=True):
+        client = sap_control_module._get_client(  # pylint: disable=protected-access
+            "00", "sapadm", "Abcd1234", fqdn="sap.my.domain"
+        )
+    assert client is https_client
+    assert key not in sap_control_module._CLIENT_CACHE  # pylint: disable=protected-access
+    http_client.transport.session.close.assert_called_once_with()
+
+
+class FakeClock:
+    """
+    Replaces the time module for polling tests
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_poll_backoff():
+    """
+    Test that the poll interval grows up to the maximum interval
+    """
+    clock = FakeClock()
+    results = iter([False, False, False, False, True])
+    with patch.object(sap_control_module, "time", clock):
+        assert sap_control_module._poll(  # pylint: disable=protected-access
+            lambda: next(results), timeout=60, initial=1, max_interval=3, backoff=2
+        )
+    assert clock.sleeps == [1, 2, 3, 3]
+
+
+def test_poll_timeout():
+    """
+    Test that polling never sleeps past the deadline
+    """
+    clock = FakeClock()
+    with patch.object(sap_control_module, "time", clock):
+        assert not sap_control_module._poll(  # pylint: disable=protected-access
+            lambda: False, timeout=2.5, initial=1, max_interval=2, backoff=2
+        )
+    assert clock.sleeps == [1, 1.5]
+    assert clock.now == 2.5
+
+
+def _process(name, dispstatus="SAPControl-GREEN", pid=1):
+    return {"name": name, "dispstatus": dispstatus, "pid": pid}
+
+
+def _client(processes):
+    client = MagicMock()
+    client.service.GetProcessList.return_value = processes
+    return client
+
+
+@pytest.mark.parametrize(
+    "dispstatus,expected",
+    [
+        (["SAPControl-GREEN", "SAPControl-GREEN"], sap_control_module.SAPCONTROL_GREEN),
+        (["SAPControl-GRAY", "SAPControl-GRAY"], sap_control_module.SAPCONTROL_GRAY),
+        (["SAPControl-GREEN", "SAPControl-YELLOW"], sap_control_module.SAPCONTROL_YELLOW),
+        (["SAPControl-YELLOW", "SAPControl-RED"], sap_control_module.SAPCONTROL_RED),
+        (["SAPControl-GREEN", "SAPControl-GRAY"], sap_control_module.SAPCONTROL_YELLOW),
+        ([], sap_control_module.SAPCONTROL_YELLOW),
+    ],
+)
+def test_local_dispstatus(dispstatus, expected):
+    """
+    Test the aggregation of the process statuses to the instance status
+    """
+    client = _client([_process(f"p{i}", status) for i, status in enumerate(dispstatus)])
+    assert (
+        sap_control_module._local_dispstatus(client) == expected
+    )  # pylint: disable=protected-access
+
+
+def test_local_dispstatus_unknown():
+    """
+    Test that unknown process statuses are not treated as stopped
+    """
+    client = _client([_process("disp+work", "SAPControl-BLUE")])
+    with pytest.raises(Exception, match="Unknown process status"):
+        sap_control_module._local_dispstatus(client)  # pylint: disable=protected-access
+
+
+def test_instance_status_local():
+    """
+    Test that the status of a local instance is derived from its process list
+    """
+    client = _client([_process("disp+work", "SAPControl-GRAY")])
+    ret = sap_control_module.instance_status("00", "sapadm", "Abcd1234", client=client)
+    assert ret == sap_control_module.SAPCONTROL_GRAY
+    client.service.GetSystemInstanceList.assert_not_called()
+
+
+def test_find_processes_stops_early():
+    """
+    Test that only the requested processes are returned
+    """
+    processes = [_process("disp+work"), _process("igswd_mt"), MagicMock()]
+    ret = sap_control_module._find_processes(  # pylint: disable=protected-access
+        _client(processes), ["igswd_mt", "disp+work"]
+    )
+    assert ret == {"disp+work": processes[0], "igswd_mt": processes[1]}
+    # the scan stopped before the last entry
+    processes[2].__getitem__.assert_not_called()
+
+
+def test_find_processes_missing():
+    """
+    Test that processes which are not running are not part of the result
+    """
+    ret = sap_control_module._find_processes(  # pylint: disable=protected-access
+        _client([_process("disp+work")]), ["disp+work", "gwrd"]
+    )
+    assert list(ret) == ["disp+work"]
+
+
+def test_get_syslog_errors():
+    """
+    Test that syslog entries are filtered by severity and timestamp
+    """
+    entries = [
+        MagicMock(Severity="SAPControl-RED", Time="2022 11 22 10:00:01"),
+        MagicMock(Severity="SAPControl-RED", Time="2022 11 22 09:59:59"),
+        MagicMock(Severity="SAPControl-YELLOW", Time="2022 11 22 11:00:00"),
+        MagicMock(Severity="SAPControl-RED", Time="invalid"),
+    ]
+    client = MagicMock()
+    client.service.ABAPReadSyslog.return_value = entries
+    with patch.object(sap_control_module, "_get_client", return_value=client):
+        ret = sap_control_module.get_syslog_errors(
+            datetime.datetime(2022, 11, 22, 10, 0, 0), "00", "sapadm", "Abcd1234"
+        )
+    assert ret == entries[:1]
@@ -0,0 +1,44 @@
+"""
+Unit tests for the sap_control state module
+"""
+import pytest
+import saltext.sap_control._states.sap_control as sap_control_state
+
+SHOWCONNECT_OUTPUT = """\
+Connection parameters:
+  host_param = 'sld.my.domain'
+  port_param = '50001'
+  user_param = 'SLD_DS_USER'
+  https_param = 'y'
+  keyfile = '/usr/sap/S4H/SYS/global/sld/sld.cfg'
+"""
+
+
+@pytest.fixture
+def configure_loader_modules():
+    return {sap_control_state: {}}
+
+
+def test_parse_showconnect():
+    """
+    Test that the connection parameters are parsed line by line
+    """
+    ret = sap_control_state._parse_showconnect(  # pylint: disable=protected-access
+        SHOWCONNECT_OUTPUT
+    )
+    assert ret == {
+        "host_param": "sld.my.domain",
+        "port_param": "50001",
+        "user_param": "SLD_DS_USER",
+        "https_param": "y",
+    }
+
+
+def test_parse_showconnect_empty():
+    """
+    Test that output without connection parameters results in an empty configuration
+    """
+    assert not sap_control_state._parse_showconnect("")  # pylint: disable=protected-access
+    assert not sap_control_state._parse_showconnect(  # pylint: disable=protected-access
+        "no configuration found"
+    )